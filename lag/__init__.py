@@ -1,8 +1,45 @@
 import time
-from itertools import product
-from functools import partial
+from itertools import product, starmap, repeat
+import sys
+from collections import deque
+from collections.abc import Sequence
+from functools import lru_cache
 
-round_up_to_two_digits = partial(round, ndigits=2)
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """numpy if it's installed, None if not.
+
+    numpy is optional (it's only used to vectorize the processing of timings), and heavy to import,
+    so it's only imported when first needed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def round_up_to_two_digits(x, _round=round):
+    return _round(x, 2)
+
+
+def round2_all(xs):
+    """Round all the numbers of xs to two digits. In one vectorized pass if xs is a numpy array.
+
+    >>> round2_all([0.123, 4.567])
+    [0.12, 4.57]
+    """
+    np = sys.modules.get('numpy')  # if xs is a numpy array, numpy was already imported
+    if np is not None and isinstance(xs, np.ndarray):
+        return np.round(xs, 2)
+    return [round(x, 2) for x in xs]
+
+
+# Timers work in integer nanoseconds (no float drift when accumulating) and convert to seconds on read.
+_perf = time.perf_counter_ns  # the default clock, bound once so it's not looked up on the time module on every call
+_NS_TO_S = 1e-9
+_S_TO_NS = 1_000_000_000
 
 
 class TimedContext:
@@ -14,18 +51,68 @@ class TimedContext:
     ...     sleep(0.5)
     >>> round_up_to_two_digits(tc.elapsed)
     0.5
+
+    The start and end of the timing are also available (in seconds, like elapsed).
+
+    >>> round_up_to_two_digits(tc.end - tc.start)
+    0.5
+
+    By default, the clock is time.perf_counter_ns: wall time, which includes sleeps, IO, and other processes getting
+    the CPU. To measure CPU-bound code with less noise, you can use time.thread_time_ns instead, which only counts the
+    CPU time of the current thread (so here, sleeping doesn't count).
+    Any function returning integer nanoseconds can be used (for instance, one based on GPU events).
+
+    >>> with TimedContext(clock=time.thread_time_ns) as tc:
+    ...     sleep(0.5)
+    >>> round_up_to_two_digits(tc.elapsed)
+    0.0
+
+    Subclasses whose __init__ doesn't call super().__init__ (so never set a clock) use the default clock.
+
+    >>> class MyTimer(TimedContext):
+    ...     def __init__(self, name):
+    ...         self.name = name
+    >>> with MyTimer('mine') as t:
+    ...     sleep(0.2)
+    >>> round_up_to_two_digits(t.elapsed)
+    0.2
     """
 
+    __slots__ = ('_start', '_elapsed_ns', '_clock')
+
+    def __init__(self, clock=_perf):
+        self._clock = clock
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, so it doesn't cost anything when the clock was set
+        if name == '_clock':
+            return _perf
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
     def __enter__(self):
-        self.start = time.perf_counter()
+        self._start = self._clock()
         return self
 
     def __exit__(self, *args):
-        self.end = time.perf_counter()
-        self.elapsed = self.end - self.start
+        self._elapsed_ns = self._clock() - self._start
+
+    @property
+    def elapsed(self):
+        """The elapsed time, in seconds"""
+        return self._elapsed_ns * _NS_TO_S
+
+    @property
+    def start(self):
+        """The clock time the timing started at, in seconds"""
+        return self._start * _NS_TO_S
 
+    @property
+    def end(self):
+        """The clock time the timing ended at, in seconds"""
+        return (self._start + self._elapsed_ns) * _NS_TO_S
 
-class CumulativeTimings(list, TimedContext):
+
+class CumulativeTimings:
     """Context manager that is meant to be used in a loop to time and accumulate both timings and relevant data.
 
     >>> from functools import partial
@@ -43,6 +130,14 @@ class CumulativeTimings(list, TimedContext):
     >>> list(map(round_up_to_two_digits, cumul_timing))
     [0.0, 0.2, 0.4, 0.6]
 
+    You also get some stats on the timings (computed with numpy if it's installed, in pure python if not).
+    Either way, they raise a StatisticsError if there are no timings.
+
+    >>> round_up_to_two_digits(cumul_timing.mean())
+    0.3
+    >>> round_up_to_two_digits(cumul_timing.quantile(0.5))
+    0.3
+
 
     You can also add some data to the accumulation by calling the instance of CumulativeTimings
     Note: Calling cumul_timing to tell it to store some data for a loop step does have an overhead, so
@@ -53,21 +148,33 @@ class CumulativeTimings(list, TimedContext):
     ...         sleep(i * 0.2)
     ...     cumul_timing.append_data(f"index: {i}")
     >>>
-    >>> list(zip(map(round_up_to_two_digits, cumul_timing), cumul_timing.data_store))
+    >>> list(zip(map(round_up_to_two_digits, cumul_timing), cumul_timing.datas))
     [(0.0, 'index: 0'), (0.2, 'index: 1'), (0.4, 'index: 2'), (0.6, 'index: 3')]
 
     """
     no_data = type('NoData', (), {})
+    __slots__ = ('_timings', 'datas', '_t0', '_elapsed_ns', '_clock', 'batch_sizes')
 
-    def __init__(self, datas=None):
-        super().__init__()
+    def __init__(self, datas=None, clock=_perf):
+        self._timings = list()
+        self._clock = clock
+        self.batch_sizes = None  # number of calls each timing is an average over, if not 1 (see measure_many)
         if datas is not None:
-            assert hasattr(datas, 'append') and hasattr(datas, 'len'), \
+            assert hasattr(datas, 'append') and hasattr(datas, '__len__'), \
                 "data_store needs to have methods: append and __len__"
             self.datas = datas
         else:
             self.datas = list()
 
+    @classmethod
+    def from_ns(cls, timings, datas=None, clock=_perf):
+        """Make a CumulativeTimings from already collected timings (a list of integer nanoseconds) and datas"""
+        self = cls(datas, clock)
+        self._timings = timings
+        if timings:
+            self._elapsed_ns = timings[-1]
+        return self
+
     def append_data(self, data):
         """Append data to the data_store.
 
@@ -77,18 +184,237 @@ class CumulativeTimings(list, TimedContext):
         Will raise an assertion error if length of datas (+1) doesn't equal the current length of the CumulativeTimings
         list. This is so as to avoid misalignments between timing and data
         """
-        assert (len(self.datas) + 1) == len(self), \
-            f"append_data can only be called if your data_store has exactly one less item than your timings list. " \
-            f"What you have is len(self.data_store)={len(self.datas)} " \
-            f"and len(self)={len(self)}"
+        if __debug__ and (len(self.datas) + 1) != len(self):
+            raise AssertionError(
+                f"append_data can only be called if your data_store has exactly one less item than your timings list. "
+                f"What you have is len(self.data_store)={len(self.datas)} "
+                f"and len(self)={len(self)}")
         self.datas.append(data)
 
+    def __len__(self):
+        return len(self._timings)
+
+    def __iter__(self):
+        return iter(self.seconds())
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [x * _NS_TO_S for x in self._timings[k]]
+        return self._timings[k] * _NS_TO_S
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.seconds()})"
+
+    def append(self, timing):
+        """Append a timing, in seconds (like the timings you read back). It's stored as integer nanoseconds.
+
+        >>> c = CumulativeTimings()
+        >>> c.append(0.5)
+        >>> c[-1]
+        0.5
+        """
+        self._timings.append(round(timing * _S_TO_NS))
+
+    def seconds(self):
+        """The accumulated timings, in seconds (they're stored as integer nanoseconds)"""
+        return [x * _NS_TO_S for x in self._timings]
+
+    def to_numpy(self):
+        """The accumulated timings, in seconds, as a numpy float64 array (requires numpy)"""
+        np = _numpy()
+        if np is None:
+            raise ImportError("to_numpy requires numpy, which is not installed")
+        return np.fromiter(self._timings, dtype=np.int64, count=len(self._timings)) * _NS_TO_S
+
+    def _check_nonempty(self, stat):
+        # so that stats fail the same way whether they're computed with numpy or not
+        if not self._timings:
+            import statistics
+
+            raise statistics.StatisticsError(f"{stat} requires at least one timing")
+
+    def mean(self):
+        """Mean of the timings, in seconds"""
+        self._check_nonempty('mean')
+        if _numpy() is not None:
+            return float(self.to_numpy().mean())
+        import statistics
+
+        return statistics.fmean(self.seconds())
+
+    def std(self):
+        """(Population) standard deviation of the timings, in seconds"""
+        self._check_nonempty('std')
+        if _numpy() is not None:
+            return float(self.to_numpy().std())
+        import statistics
+
+        return statistics.pstdev(self.seconds())
+
+    def quantile(self, q):
+        """The q-th quantile (0 <= q <= 1) of the timings, in seconds, linearly interpolated (as numpy does)
+
+        >>> CumulativeTimings.from_ns([1, 2, 3, 10]).quantile(1.5)
+        Traceback (most recent call last):
+          ...
+        ValueError: Quantiles must be in the range [0, 1]
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantiles must be in the range [0, 1]")
+        self._check_nonempty('quantile')
+        np = _numpy()
+        if np is not None:
+            return float(np.quantile(self.to_numpy(), q))
+        x = sorted(self.seconds())
+        pos = q * (len(x) - 1)
+        i = int(pos)
+        if i + 1 < len(x):
+            return x[i] + (pos - i) * (x[i + 1] - x[i])
+        return x[i]
+
+    @property
+    def elapsed(self):
+        """The elapsed time of the last timing, in seconds"""
+        return self._elapsed_ns * _NS_TO_S
+
+    def __enter__(self):
+        self._t0 = self._clock()
+        return self
+
     def __exit__(self, *args):
-        super().__exit__(*args)
-        self.append(self.elapsed)
+        e = self._clock() - self._t0
+        self._elapsed_ns = e
+        self._timings.append(e)
+
+
+class ArgsAndOutputs(Sequence):
+    """The (*func_args, func_output) items that time_multiple_calls collects when asked to (with columnar=True).
+
+    Arguments and outputs are stored as two parallel lists (args and outputs), and only assembled into tuples
+    when accessed, so that timing loops don't have to build a tuple per call.
+
+    Note that it's a read-only Sequence (plus append), not a list: It compares equal to (and displays as) the list
+    of its items, but doesn't support list operations like +, extend, or sort, nor json serialization.
+    Use list(d) if you need an actual list.
+
+    >>> d = ArgsAndOutputs([(1, 2), (3, 4)], [3, 7])
+    >>> d
+    [(1, 2, 3), (3, 4, 7)]
+    >>> d[1]
+    (3, 4, 7)
+    >>> d.append((5, 6, 11))
+    >>> d == [(1, 2, 3), (3, 4, 7), (5, 6, 11)]
+    True
+    >>> d.outputs
+    [3, 7, 11]
+    >>> d == ()  # only lists (and other ArgsAndOutputs) can be equal to it
+    False
+    >>> list(d) + [(7, 8, 15)]
+    [(1, 2, 3), (3, 4, 7), (5, 6, 11), (7, 8, 15)]
+    """
 
+    __slots__ = ('args', 'outputs')
 
-def time_multiple_calls(func, arguments, return_func_args=True, include_func_output=True):
+    def __init__(self, args=None, outputs=None):
+        self.args = args if args is not None else list()
+        self.outputs = outputs if outputs is not None else list()
+
+    def __len__(self):
+        return len(self.outputs)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [(*a, o) for a, o in zip(self.args[k], self.outputs[k])]
+        return (*self.args[k], self.outputs[k])
+
+    def append(self, data):
+        """Append a (*func_args, func_output) item"""
+        *func_args, func_output = data
+        self.args.append(tuple(func_args))
+        self.outputs.append(func_output)
+
+    def __eq__(self, other):
+        if isinstance(other, ArgsAndOutputs):
+            return self.args == other.args and self.outputs == other.outputs
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+# Specialized timing loops, one per output_kind, so that the kind is dispatched on once, not on every call.
+# They time inline (no context manager) and accumulate into raw lists, with the methods they need bound to locals.
+
+def _loop_both(func, arguments, timings, datas, clock):
+    perf, t_append, d_append = clock, timings.append, datas.append
+    for func_args in arguments:
+        t0 = perf()
+        func_output = func(*func_args)
+        t_append(perf() - t0)
+        d_append((*func_args, func_output))
+
+
+def _loop_both_columns(func, arguments, timings, datas, clock):
+    # datas is an ArgsAndOutputs here: append to its parallel lists rather than build a (*func_args, output) tuple
+    perf, t_append, a_append, o_append = clock, timings.append, datas.args.append, datas.outputs.append
+    for func_args in arguments:
+        t0 = perf()
+        func_output = func(*func_args)
+        t_append(perf() - t0)
+        a_append(func_args if type(func_args) is tuple else tuple(func_args))  # snapshot mutable args
+        o_append(func_output)
+
+
+def _loop_out(func, arguments, timings, datas, clock):
+    perf, t_append, d_append = clock, timings.append, datas.append
+    for func_args in arguments:
+        t0 = perf()
+        func_output = func(*func_args)
+        t_append(perf() - t0)
+        d_append(func_output)
+
+
+def _loop_args(func, arguments, timings, datas, clock):
+    perf, t_append, d_append = clock, timings.append, datas.append
+    for func_args in arguments:
+        t0 = perf()
+        func(*func_args)
+        t_append(perf() - t0)
+        d_append(func_args)
+
+
+def _loop_none(func, arguments, timings, datas, clock):
+    perf, t_append = clock, timings.append
+    if not isinstance(arguments, (list, tuple)):
+        for func_args in arguments:
+            t0 = perf()
+            func(*func_args)
+            t_append(perf() - t0)
+        return
+    # Nothing to keep but timings, and getting the next arguments is just a C-level item access (it can't run
+    # user code, as a generator could), so let starmap do the iteration and unpacking in C.
+    t0 = perf()
+    for _ in starmap(func, arguments):
+        t_append(perf() - t0)
+        t0 = perf()
+
+
+# output kinds, as small int constants
+_KIND_NONE, _KIND_ARGS, _KIND_OUT, _KIND_BOTH, _KIND_BOTH_COLUMNS = range(5)
+
+_LOOPS = {
+    _KIND_BOTH: _loop_both,
+    _KIND_BOTH_COLUMNS: _loop_both_columns,
+    _KIND_OUT: _loop_out,
+    _KIND_ARGS: _loop_args,
+    _KIND_NONE: _loop_none,
+}
+
+
+def time_multiple_calls(func, arguments, return_func_args=True, include_func_output=True, clock=_perf,
+                        columnar=False):
     """
     Feed collections of arguments to a function, measure how much time it takes to run,
     and output the timings (and possible function inputs and outputs).
@@ -97,6 +423,10 @@ def time_multiple_calls(func, arguments, return_func_args=True, include_func_out
     :param arguments: an iterable of (position) arguments to feed to func
     :param return_func_args: Whether to return the arguments
     :param include_func_output: Whether to include the output of the function in the
+    :param clock: The clock (a function returning integer nanoseconds) to time with. See TimedContext.
+    :param columnar: When returning both args and outputs, whether to collect them in an ArgsAndOutputs (two parallel
+        lists, args and outputs) instead of a list of (*func_args, func_output) tuples. That saves building a tuple
+        per call, but the result is a Sequence, not a list.
     :return:
 
     >>> from time import sleep
@@ -111,38 +441,209 @@ def time_multiple_calls(func, arguments, return_func_args=True, include_func_out
     >>> args
     [(0.2, 0.3, 0.06), (0.5, 0.8, 0.4), (0.5, 2, 1.0)]
 
+    With columnar=True, args and outputs are kept apart (but can still be read as the same tuples)
+
+    >>> timings, args = time_multiple_calls(pow, [(2, 3), (3, 2)], columnar=True)
+    >>> args.args, args.outputs
+    ([(2, 3), (3, 2)], [8, 9])
+    >>> args == [(2, 3, 8), (3, 2, 9)]
+    True
     """
     if return_func_args or include_func_output:
         if return_func_args:
             if include_func_output:
-                output_kind = 'func_args_and_output'
+                output_kind = _KIND_BOTH_COLUMNS if columnar else _KIND_BOTH
             else:
-                output_kind = 'func_args'
+                output_kind = _KIND_ARGS
         else:
-            output_kind = 'func_output'
+            output_kind = _KIND_OUT
     else:
-        output_kind = 'only_timings'
-    cumul_timing = CumulativeTimings()
-    for func_args in arguments:
-        with cumul_timing:
-            func_output = func(*func_args)
-        if output_kind != 'only_timings':
-            data = None
-            if output_kind == 'func_args_and_output':
-                data = (*func_args, func_output)
-            elif output_kind == 'func_output':
-                data = func_output
-            elif output_kind == 'func_args':
-                data = func_args
-            cumul_timing.append_data(data)
-
-    if output_kind != 'only_timings':
+        output_kind = _KIND_NONE
+    timings = list()
+    datas = ArgsAndOutputs() if output_kind == _KIND_BOTH_COLUMNS else list()
+    _LOOPS[output_kind](func, arguments, timings, datas, clock)
+    cumul_timing = CumulativeTimings.from_ns(timings, datas, clock)
+
+    if output_kind != _KIND_NONE:
         return cumul_timing, cumul_timing.datas
     else:
         return cumul_timing
 
 
-def time_arg_combinations(func, args_base, return_func_args=True, include_func_output=True):
+def measure_many(func, arguments, min_total_ns=1_000_000, clock=_perf):
+    """
+    Time very fast functions: For every set of arguments, func is called n times in a row between two clock reads,
+    doubling n until those n calls take at least min_total_ns (as timeit.Timer.autorange does), so that the
+    overhead of reading the clock is amortized over many calls.
+
+    :param func: Function that will be called on all arguments
+    :param arguments: an iterable of (position) arguments to feed to func
+    :param min_total_ns: The minimum time (in nanoseconds) a batch of calls must take
+    :param clock: The clock (a function returning integer nanoseconds) to time with. See TimedContext.
+    :return: A CumulativeTimings holding the (estimated) time of one call for every arguments,
+        with the arguments as datas, and the number of calls each estimate was made with as batch_sizes.
+
+    >>> timings = measure_many(pow, [(2, 10), (3, 100)])
+    >>> timings.datas
+    [(2, 10), (3, 100)]
+    >>> len(timings), len(timings.batch_sizes)
+    (2, 2)
+    >>> timings.batch_sizes[0] > 1  # pow is so fast that a single call would be dominated by clock overhead
+    True
+    """
+    timings, datas, batch_sizes = list(), list(), list()
+    for func_args in arguments:
+        n = 1
+        while True:
+            t0 = clock()
+            deque(starmap(func, repeat(func_args, n)), maxlen=0)  # consumes the calls in C
+            total = clock() - t0
+            if total >= min_total_ns:
+                break
+            n *= 2
+        timings.append(total // n)
+        datas.append(func_args)
+        batch_sizes.append(n)
+    cumul_timing = CumulativeTimings.from_ns(timings, datas, clock)
+    cumul_timing.batch_sizes = batch_sizes
+    return cumul_timing
+
+
+def _is_numba_compiled(func):
+    return type(func).__name__ == 'CPUDispatcher'
+
+
+@lru_cache(maxsize=None)
+def _clock_gettime():
+    """libc's clock_gettime, as a ctypes function that numba can call in nopython mode (None if it's not available)"""
+    import ctypes
+
+    if ctypes.sizeof(ctypes.c_long) != 8:  # the compiled loop reads the timespec as two int64s
+        return None
+    try:
+        clock_gettime = ctypes.CDLL(None).clock_gettime
+    except (OSError, TypeError, AttributeError):  # e.g. on windows
+        return None
+    clock_gettime.argtypes = [ctypes.c_int, ctypes.c_void_p]
+    clock_gettime.restype = ctypes.c_int
+    return clock_gettime
+
+
+def _jit_clock_id(clock):
+    """The clock_gettime id of clock, if the compiled loop can read it (None if not)"""
+    if _clock_gettime() is None:
+        return None
+    clock_ids = {
+        time.perf_counter_ns: getattr(time, 'CLOCK_MONOTONIC', None),
+        time.monotonic_ns: getattr(time, 'CLOCK_MONOTONIC', None),
+        time.thread_time_ns: getattr(time, 'CLOCK_THREAD_CPUTIME_ID', None),
+    }
+    return clock_ids.get(clock)
+
+
+_jit_kernels = {}  # number of func arguments -> numba-compiled timing loop
+
+
+def _jit_kernel(n_args):
+    """Get (compiling it the first time) the numba timing loop for a func of n_args arguments"""
+    if n_args not in _jit_kernels:
+        import numba
+
+        # The clock is read with clock_gettime (through ctypes) so the loop never leaves nopython mode.
+        # numba can't star-unpack an array row, so the call is written out for the given number of arguments.
+        call_args = ', '.join(f'X[i, {j}]' for j in range(n_args))
+        src = (
+            "def _run(f, X, timings, outputs, clock_id):\n"
+            "    ts = np.empty(2, dtype=np.int64)\n"
+            "    ts_ptr = ts.ctypes.data\n"
+            "    for i in range(X.shape[0]):\n"
+            "        clock_gettime(clock_id, ts_ptr)\n"
+            "        t0 = ts[0] * 1_000_000_000 + ts[1]\n"
+            f"        outputs[i] = f({call_args})\n"
+            "        clock_gettime(clock_id, ts_ptr)\n"
+            "        timings[i] = ts[0] * 1_000_000_000 + ts[1] - t0\n"
+        )
+        namespace = {'np': _numpy(), 'clock_gettime': _clock_gettime()}
+        exec(src, namespace)
+        _jit_kernels[n_args] = numba.njit(namespace['_run'])
+    return _jit_kernels[n_args]
+
+
+def time_multiple_calls_jit(func, args_array, clock=_perf):
+    """
+    Time multiple calls of a numba-compiled (nopython) function, with the loop itself compiled by numba too.
+
+    Meant for when func is so cheap that the python loop of time_multiple_calls would dominate the timings.
+    The compiled loop only handles numerical (bool, int or float) arguments and a scalar numerical output: The
+    arguments keep their dtype (ints stay ints), and the outputs get the type of the first call's output.
+    Falls back to time_multiple_calls if func isn't numba-compiled (or numba isn't installed), if the arguments or
+    output aren't of those types, if numba can't compile the loop for func (a TypingError), or if the clock can't be
+    read from compiled code (only perf_counter_ns, monotonic_ns and thread_time_ns can, and not on windows).
+
+    :param func: A numba.njit function taking as many numerical arguments as args_array has columns,
+        and returning a number
+    :param args_array: A 2D array of arguments: One row per call
+    :param clock: The clock (a function returning integer nanoseconds) to time with. See TimedContext.
+    :return: The timings (a CumulativeTimings) and the func outputs, as time_multiple_calls would with
+        return_func_args=False
+
+    >>> try:
+    ...     from numba import njit
+    ... except ImportError:  # without numba, the same examples go through the time_multiple_calls fallback
+    ...     njit = lambda func: func
+    >>> @njit
+    ... def mult(x, y):
+    ...     return x * y
+    >>> timings, outputs = time_multiple_calls_jit(mult, [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    >>> outputs
+    [2.0, 12.0, 30.0]
+    >>> len(timings)
+    3
+    >>> all(t >= 0 for t in timings)
+    True
+    >>> @njit
+    ... def div_mod(x, y):
+    ...     return x // y, x % y
+    >>> time_multiple_calls_jit(div_mod, [[7, 2], [9, 3]])[1]  # int arguments stay ints, tuple outputs fall back
+    [(3, 1), (3, 0)]
+    >>> time_multiple_calls_jit(mult, [])
+    (CumulativeTimings([]), [])
+    """
+
+    def fallback():
+        return time_multiple_calls(func, args_array, return_func_args=False, include_func_output=True, clock=clock)
+
+    clock_id = _jit_clock_id(clock)
+    if not _is_numba_compiled(func) or clock_id is None:
+        return fallback()
+    np = _numpy()
+    X = np.asarray(args_array)
+    if len(X) == 0:
+        cumul_timing = CumulativeTimings.from_ns(list(), list(), clock)
+        return cumul_timing, cumul_timing.datas
+    if X.ndim != 2:
+        raise ValueError(f"args_array must be 2D (one row of arguments per call), but has shape {X.shape}")
+    if X.dtype.kind not in 'biuf':
+        return fallback()
+    X = np.ascontiguousarray(X)
+
+    from numba.core.errors import TypingError
+
+    try:
+        first_output = np.asarray(func(*X[0]))  # not timed: just to know what outputs to allocate
+        if first_output.ndim != 0 or first_output.dtype.kind not in 'biufc':
+            return fallback()
+        timings = np.empty(X.shape[0], dtype=np.int64)
+        outputs = np.empty(X.shape[0], dtype=first_output.dtype)
+        _jit_kernel(X.shape[1])(func, X, timings, outputs, clock_id)
+    except TypingError:
+        return fallback()
+    cumul_timing = CumulativeTimings.from_ns(timings.tolist(), outputs.tolist(), clock)
+    return cumul_timing, cumul_timing.datas
+
+
+def time_arg_combinations(func, args_base, return_func_args=True, include_func_output=True, batched=False,
+                          clock=_perf, columnar=False):
     """
     Feed combinations of arguments to a function, measure how much time it takes to run,
     and output the timings (and possible function inputs and outputs.
@@ -150,6 +651,10 @@ def time_arg_combinations(func, args_base, return_func_args=True, include_func_o
     :param func: Function that will be called on all argument combinations
     :param args_base: a collection of iterables of arguments from which to create the combinatorial mesh
     :param include_func_output: Whether to include the output of the function in the
+    :param batched: If True (requires numpy), func is taken to be vectorized: It's called only once, on the
+        (flattened) arrays of the whole combinatorial mesh, and that single call is timed.
+    :param clock: The clock (a function returning integer nanoseconds) to time with. See TimedContext.
+    :param columnar: Whether to collect args and outputs in an ArgsAndOutputs. See time_multiple_calls.
     :return:
 
     >>> from time import sleep
@@ -163,9 +668,32 @@ def time_arg_combinations(func, args_base, return_func_args=True, include_func_o
     [0.2, 0.5, 0.4, 1.0]
     >>> args
     [(0.1, 2, 0.2), (0.1, 5, 0.5), (0.2, 2, 0.4), (0.2, 5, 1.0)]
+
+    In batched mode, a vectorized func is called (and timed) once, on the whole mesh, raveled in the same order as
+    the (non-batched) combinations above.
+
+    >>> def vectorized_func(i, j):
+    ...     return i * j
+    >>> try:
+    ...     timings, args = time_arg_combinations(vectorized_func, args_base=([1, 2], [3, 4, 5]), batched=True)
+    ... except ImportError:  # batched mode requires numpy, so there's nothing to check without it
+    ...     pass
+    ... else:
+    ...     assert len(timings) == 1 and len(args) == 1
+    ...     assert [tuple(map(int, row)) for row in zip(*args[0])] == [
+    ...         (1, 3, 3), (1, 4, 4), (1, 5, 5), (2, 3, 6), (2, 4, 8), (2, 5, 10)]
     """
-    return time_multiple_calls(func, product(*args_base),
-                               return_func_args=return_func_args, include_func_output=include_func_output)
+    if batched:
+        np = _numpy()
+        if np is None:
+            raise ImportError("batched=True requires numpy, which is not installed")
+        meshed = np.meshgrid(*map(np.asarray, args_base), indexing='ij')
+        arguments = [tuple(m.ravel() for m in meshed)]
+    else:
+        arguments = product(*args_base)
+    return time_multiple_calls(func, arguments,
+                               return_func_args=return_func_args, include_func_output=include_func_output,
+                               clock=clock, columnar=columnar)
 
 
 class TimerAndFeedback(TimedContext):
@@ -183,7 +711,10 @@ class TimerAndFeedback(TimedContext):
     >>> # but you still have access to some stats through feedback object (like elapsed, started, etc.)
     """
 
-    def __init__(self, start_msg="", end_msg="", verbose=True, print_func=print):
+    __slots__ = ('start_msg', 'end_msg', 'verbose', 'print_func')
+
+    def __init__(self, start_msg="", end_msg="", verbose=True, print_func=print, clock=_perf):
+        super().__init__(clock)
         self.start_msg = start_msg
         if end_msg:
             end_msg += '\n'
@@ -197,12 +728,17 @@ class TimerAndFeedback(TimedContext):
                 return self.print_func(*args, **kwargs)
 
     def __enter__(self):
-        self.print_if_verbose(self.start_msg)
-        return super().__enter__()
+        if self.verbose and self.start_msg:
+            self.print_func(self.start_msg)
+        self._start = self._clock()
+        return self
 
     def __exit__(self, *args):
-        super().__exit__()
-        self.print_if_verbose(self.end_msg + f"Took {self.elapsed:0.1f} seconds")
+        self._elapsed_ns = self._clock() - self._start
+        if not self.verbose:  # silent: don't even build the message
+            return
+        # end_msg (with its newline) was prepared in __init__, so only the elapsed time is formatted here
+        self.print_func(self.end_msg + f"Took {self._elapsed_ns * _NS_TO_S:0.1f} seconds")
 
     def __repr__(self):
         return f"elapsed={self.elapsed} (start={self.start}, end={self.end})"
@@ -227,14 +763,46 @@ class TimerAndCallback(TimedContext):
 
     """
 
-    def __init__(self, callback=lambda x: x):
+    __slots__ = ('callback', 'extra_callback_data')
+
+    def __init__(self, callback=lambda x: x, clock=_perf):
+        super().__init__(clock)
         self.callback = callback
         self.extra_callback_data = None
 
+    @classmethod
+    def reusable(cls, callback=lambda x: x, clock=_perf):
+        """Make a TimerAndCallback meant to be made once and entered repeatedly (e.g. hoisted out of a loop),
+        instead of making a new one for every timing.
+
+        Every enter resets extra_callback_data, so that data given for one timing doesn't leak into the next.
+        Note that the instance is neither re-entrant nor thread-safe.
+
+        >>> from time import sleep
+        >>> cumul = list()
+        >>> tc = TimerAndCallback.reusable(cumul.append)
+        >>> for i in range(3):
+        ...    with tc:
+        ...        sleep(i * 0.2)
+        >>> assert list(map(round_up_to_two_digits, cumul)) == [0.0, 0.2, 0.4]
+        """
+        return _ReusableTimerAndCallback(callback, clock)
+
     def __exit__(self, *args):
-        super().__exit__()
+        self._elapsed_ns = self._clock() - self._start
 
         if self.extra_callback_data is not None:
             self.callback((self.elapsed, self.extra_callback_data))
         else:
             self.callback(self.elapsed)
+
+
+class _ReusableTimerAndCallback(TimerAndCallback):
+    """A TimerAndCallback that resets its state on enter. Use TimerAndCallback.reusable to make one."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        self.extra_callback_data = None
+        self._start = self._clock()
+        return self